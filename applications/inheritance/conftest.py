@@ -0,0 +1,24 @@
+"""
+pytest configuration for the inheritance test suite
+
+The tests that communicate with the APIC are marked as live so that they can be selected with
+``-m live``. Tests that share configuration outside of their own tenants, i.e. in tenant common,
+are placed in the same xdist_group so that ``--dist=loadgroup`` runs them on a single worker.
+"""
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'live: test communicates with the APIC given in the credentials .ini file')
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        cls = getattr(item, 'cls', None)
+        if cls is None:
+            continue
+        if getattr(cls, 'live', False):
+            item.add_marker(pytest.mark.live)
+        group = getattr(cls, 'xdist_group', None)
+        if group is not None:
+            item.add_marker(pytest.mark.xdist_group(name=group))
@@ -588,7 +588,7 @@ class Monitor(threading.Thread):
         relations = self.apic.get(query_url)
         for relation in relations.json()['imdata']:
             # Skip any in-band and out-of-band interfaces
-            if '/mgmtp-' in relation[relation.keys()[0]]['attributes']['dn']:
+            if '/mgmtp-' in relation[list(relation.keys())[0]]['attributes']['dn']:
                 continue
             self._relations.store_relation(RelationEvent(relation))
 
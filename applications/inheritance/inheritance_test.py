@@ -1,5 +1,18 @@
 """
 Inheritance test suite
+
+The test classes derived from BaseTestCase each use their own tenant and, when run
+with pytest-xdist, every worker suffixes the tenant names with its worker id so that
+the live tests can be run concurrently::
+
+    python -m pytest -m live -n 3 --dist=loadgroup inheritance_test.py
+
+The tests that configure tenant common are kept on a single worker by conftest.py.
+
+The suite runs under Python 2.7 and Python 3, including Python 3.10 and later where
+acitoolkit imports Sequence from collections.abc::
+
+    python3 -m unittest inheritance_test
 """
 import unittest
 from inheritance import execute_tool
@@ -11,10 +24,215 @@ import sys
 import logging
 from logging.handlers import RotatingFileHandler
 import argparse
+import atexit
+import os
 from os import getpid
-from ConfigParser import ConfigParser, NoSectionError, NoOptionError
+from six.moves.configparser import ConfigParser, NoSectionError, NoOptionError
 
 DEFAULT_INI_FILENAME = 'inheritance_apic_credentials.ini'
+TENANT_QUERY_URL = '/api/mo/uni/tn-%s.json?rsp-prop-include=naming-only'
+CONTRACT_IF_QUERY_URL = '/api/mo/uni/tn-%s/cif-%s.json?rsp-prop-include=naming-only'
+# pytest-xdist identifies each worker (gw0, gw1, ...) so that concurrent workers use their own tenants
+TENANT_NAME_SUFFIX = '-' + os.environ['PYTEST_XDIST_WORKER'] if os.environ.get('PYTEST_XDIST_WORKER') else ''
+PROVIDER_TENANT_NAME = 'inheritanceautomatedtest-provider' + TENANT_NAME_SUFFIX
+CONSUMER_TENANT_NAME = 'inheritanceautomatedtest-consumer' + TENANT_NAME_SUFFIX
+
+
+_WEB_FILTER_KW = {'applyToFrag': 'no',
+                  'arpOpc': 'unspecified',
+                  'dFromPort': '80',
+                  'dToPort': '80',
+                  'etherT': 'ip',
+                  'prot': 'tcp',
+                  'sFromPort': '1',
+                  'sToPort': '65535',
+                  'tcpRules': 'unspecified'}
+_APIC_CONFIG = {}
+_POLICIES = {}
+_CONSUMER_CONFIGS = {}
+_SHARED_APIC = None
+# Number of seconds that a state which must not change, such as a contract not being inherited, is watched for
+SETTLE_TIME = 2
+# Polling schedule used by the imported contract tests while waiting for the APIC
+IMPORTED_CONTRACT_POLL = {'timeout': 2, 'interval': 0.1, 'factor': 1.5}
+IMPORTED_CONTRACT_DELETE_POLL = dict(IMPORTED_CONTRACT_POLL, timeout=6)
+
+
+def _apic_config():
+    """
+    Get the APIC portion of the configuration JSON. Built once from the credentials
+    :return: Dictionary containing the APIC configuration
+    """
+    if not _APIC_CONFIG:
+        _APIC_CONFIG.update({"user_name": credentials.username,
+                             "password": credentials.password,
+                             "ip_address": credentials.ip_address,
+                             "use_https": False})
+    return _APIC_CONFIG
+
+
+def _get_apic():
+    """
+    Get the Session shared by all of the test classes. The Session logs in the first time it is
+    requested and keeps its token refreshed, so there is a single login per process. Each pytest-xdist
+    worker is its own process and logs in on its own
+    :return: Session instance logged into the APIC
+    """
+    global _SHARED_APIC
+    if _SHARED_APIC is None:
+        _SHARED_APIC = Session(credentials.url, credentials.username, credentials.password)
+        _SHARED_APIC.login()
+        atexit.register(_SHARED_APIC.close)
+    return _SHARED_APIC
+
+
+def _policy(tenant, container, name, allowed, enabled, container_type='l3out', inherit_from=None):
+    """
+    Get an inheritance policy. Identical policies are only built once
+    :param tenant: String containing the tenant name
+    :param container: String containing the name of the L3Out or Application Profile containing the EPG
+    :param name: String containing the EPG name
+    :param allowed: Boolean indicating whether the EPG may be inherited from
+    :param enabled: Boolean indicating whether the EPG inherits
+    :param container_type: String containing the container type i.e. 'l3out' or 'app'
+    :param inherit_from: Optional tuple of (container, name, container_type) identifying the EPG
+                         in the same tenant to inherit from
+    :return: Dictionary containing the inheritance policy
+    """
+    key = (tenant, container, name, allowed, enabled, container_type, inherit_from)
+    if key not in _POLICIES:
+        policy = {
+            "epg": {
+                "tenant": tenant,
+                "epg_container": {
+                    "name": container,
+                    "container_type": container_type
+                },
+                "name": name
+            },
+            "allowed": allowed,
+            "enabled": enabled
+        }
+        if inherit_from is not None:
+            inherit_from_container, inherit_from_name, inherit_from_type = inherit_from
+            policy["inherit_from"] = {
+                "tenant": tenant,
+                "epg_container": {
+                    "name": inherit_from_container,
+                    "container_type": inherit_from_type
+                },
+                "name": inherit_from_name
+            }
+        _POLICIES[key] = policy
+    return _POLICIES[key]
+
+
+def _poll_until(predicate, timeout=10, interval=0.05, factor=2):
+    """
+    Poll until the predicate is satisfied, backing off exponentially between polls
+    :param predicate: Callable returning True once the expected state has been reached
+    :param timeout: Maximum number of seconds to wait
+    :param interval: Initial number of seconds between polls
+    :param factor: Multiplier applied to the interval after every poll. The interval is capped at 1 second
+    :return: True if the predicate was satisfied. False if the timeout expired first
+    """
+    deadline = time.time() + timeout
+    while not predicate():
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * factor, 1)
+    return True
+
+
+def _holds_for(predicate, duration=SETTLE_TIME, interval=0.5):
+    """
+    Poll to check that the predicate stays satisfied. Used for states that the tool must not change,
+    where returning on the first satisfied poll would not give the tool any time to act
+    :param predicate: Callable returning True while the expected state holds
+    :param duration: Number of seconds that the predicate must remain satisfied
+    :param interval: Number of seconds between polls
+    :return: True if the predicate was satisfied at every poll. False as soon as it was not
+    """
+    deadline = time.time() + duration
+    while predicate():
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return True
+        time.sleep(min(interval, remaining))
+    return False
+
+
+def _push_tenants(apic, tenants):
+    """
+    Push the configuration of several tenants to the APIC in a single request
+    :param apic: Session instance assumed to be logged into the APIC
+    :param tenants: List of Tenant instances to push
+    :return: Requests Response code
+    """
+    uni_json = {'polUni': {'attributes': {},
+                           'children': [tenant.get_json() for tenant in tenants]}}
+    return apic.push_to_apic(Tenant.get_url(), uni_json)
+
+
+def _consumer_config(consumer_tenant_name):
+    """
+    Get the configuration JSON used by the imported contract tests, where the child EPG of the
+    consumer tenant inherits from its parent EPG. Built once per consumer tenant since the tool
+    does not modify the configuration it is given
+    :param consumer_tenant_name: String containing the tenant name consuming the imported contract
+    :return: Dictionary containing the configuration JSON
+    """
+    if consumer_tenant_name not in _CONSUMER_CONFIGS:
+        _CONSUMER_CONFIGS[consumer_tenant_name] = _make_config([
+            dict(tenant=consumer_tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=consumer_tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
+    return _CONSUMER_CONFIGS[consumer_tenant_name]
+
+
+def _get_child(node, child_type, child_name):
+    """
+    Get a specific immediate child of an object collected from the APIC. Equivalent to
+    node.get_child() except that the children are indexed by class and name the first time
+    the node is searched, so that later lookups do not scan all of the children again
+    :param node: Instance of an acitoolkit class
+    :param child_type: Class of the child to return
+    :param child_name: Name of the child to return
+    :return: The specific instance of child_type or None if not found
+    """
+    index = getattr(node, '_child_index', None)
+    if index is None:
+        index = {}
+        for child in node.get_children():
+            index.setdefault((type(child), child.name), child)
+        node._child_index = index
+    return index.get((child_type, child_name))
+
+
+def _build_child_subnet(consumer_tenant_name):
+    """
+    Build the tenant configuration adding a subnet to the child OutsideEPG of the consumer tenant
+    :param consumer_tenant_name: String containing the tenant name consuming the imported contract
+    :return: Instance of Tenant
+    """
+    tenant = Tenant(consumer_tenant_name)
+    l3out = OutsideL3('myl3out', tenant)
+    child_epg = OutsideEPG('childepg', l3out)
+    child_network = OutsideNetwork('5.2.1.1', child_epg)
+    child_network.ip = '5.2.1.1/16'
+    return tenant
+
+
+def _make_config(epgs):
+    """
+    Build the configuration JSON
+    :param epgs: List of dictionaries containing the keyword arguments of each inheritance policy. See _policy
+    :return: Dictionary containing the configuration JSON
+    """
+    return {"apic": _apic_config(),
+            "inheritance_policies": [_policy(**epg) for epg in epgs]}
 
 
 class ApicCredentials(object):
@@ -124,30 +342,267 @@ class FakeStdio(object):
         return output == self.output
 
 
-class BaseTestCase(unittest.TestCase):
+class ApicTestCase(unittest.TestCase):
+    """
+    Base class for the test cases that communicate with the APIC. conftest.py marks the tests of classes
+    with live set as live and keeps the tests sharing the same xdist_group on the same pytest-xdist worker
+    """
+    live = True
+    xdist_group = None
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Use the Session shared across all of the test classes
+        """
+        cls.apic = _get_apic()
+        cls.tool = None
+        cls.tool_config = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the inheritance tool started by start_tool. The shared Session is closed when the process exits
+        """
+        if cls.tool is not None:
+            cls.tool.exit()
+            cls.tool = None
+
+    @classmethod
+    def start_tool(cls, config_json):
+        """
+        Start the inheritance tool with the given configuration. The tool, and its subscriptions to the APIC,
+        are shared by the tests in the class that use the same configuration
+        :param config_json: Dictionary containing the JSON configuration
+        :return: Instance of InheritanceService
+        """
+        if cls.tool is None or cls.tool_config != config_json:
+            if cls.tool is not None:
+                cls.tool.exit()
+            cls.tool = execute_tool(TestArgs())
+            cls.tool.add_config(config_json)
+            cls.tool_config = config_json
+        return cls.tool
+
+    def push_deletion(self, apic, tenants, deleted_names):
+        """
+        Push the deletion of the tenants in a single request and wait until the deleted tenants are gone.
+        The deletion is pushed a second time only for the tenants still present after the first push
+        :param apic: Session instance assumed to be logged into the APIC
+        :param tenants: List of Tenant instances containing the deletions to push
+        :param deleted_names: Set of tenant names that must no longer be present on the APIC
+        :return: None
+        """
+        def is_deleted():
+            return not deleted_names & set(tenant.name for tenant in Tenant.get(apic))
+
+        self._invalidate_tenants()
+        resp = _push_tenants(apic, tenants)
+        self.assertTrue(resp.ok)
+        if not _poll_until(is_deleted, **IMPORTED_CONTRACT_DELETE_POLL):
+            # The APIC did not process the whole deletion. Push it once more for the tenants still present
+            present_names = set(tenant.name for tenant in Tenant.get(apic))
+            tenants = [tenant for tenant in tenants if tenant.name in present_names]
+            if tenants:
+                resp = _push_tenants(apic, tenants)
+                self.assertTrue(resp.ok)
+                _poll_until(is_deleted, **IMPORTED_CONTRACT_DELETE_POLL)
+        present_names = set(tenant.name for tenant in Tenant.get(apic))
+        self.assertFalse(present_names & deleted_names,
+                         'Tenants %s were not deleted' % ', '.join(sorted(present_names & deleted_names)))
+
+    def _invalidate_tenants(self):
+        """
+        Discard the tenants collected by _get_deep. Called whenever the test changes the APIC configuration
+        :return: None
+        """
+        self._deep_tenants = {}
+
+    def _get_deep(self, apic, tenant_names, refresh=True):
+        """
+        Get the tenants and all of their children from the APIC. The collected tenants are kept so that
+        the verification following a poll can reuse the tenants collected by the last poll
+        :param apic: Session instance assumed to be logged into the APIC
+        :param tenant_names: List of strings containing the tenant names
+        :param refresh: Boolean indicating whether to collect the tenants again. If False, the tenants are
+                        only collected if they have not been collected since they were last invalidated
+        :return: Dictionary of the Tenant instances found on the APIC keyed by tenant name
+        """
+        key = tuple(tenant_names)
+        if refresh or key not in self._deep_tenants:
+            tenants = Tenant.get_deep(apic, names=list(tenant_names), parent=Fabric())
+            self._deep_tenants[key] = dict((tenant.name, tenant) for tenant in tenants)
+        return self._deep_tenants[key]
+
+
+class BaseTestCase(ApicTestCase):
     """
     Base class for the various test cases
     """
+    inherited_contracts = ('mycontract',)
+    provide_contract_on_parent = True
+    child_subnet = True
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Each class, on each pytest-xdist worker, uses its own tenant so that the classes can be run concurrently.
+        """
+        super(BaseTestCase, cls).setUpClass()
+        cls.tenant_name = 'inheritanceautomatedtest_' + cls.__name__.lower() + TENANT_NAME_SUFFIX
+        cls.baseline_tenants = {}
+
+    def build_tenant(self):
+        """
+        Build the tenant configuration pushed by setup_tenant. By default, this is an OutsideL3
+        with a parent and a child OutsideEPG. Subclasses adjust it with the provide_contract_on_parent
+        and child_subnet class attributes or override it with their own topology
+        :return: Instance of Tenant
+        """
+        tenant = Tenant(self.tenant_name)
+        context = Context('mycontext', tenant)
+        l3out = OutsideL3('myl3out', tenant)
+        parent_epg = OutsideEPG('parentepg', l3out)
+        parent_network = OutsideNetwork('5.1.1.1', parent_epg)
+        parent_network.ip = '5.1.1.1/8'
+        child_epg = OutsideEPG('childepg', l3out)
+        if self.child_subnet:
+            child_network = OutsideNetwork('5.2.1.1', child_epg)
+            child_network.ip = '5.2.1.1/16'
+        contract = Contract('mycontract', tenant)
+        if self.provide_contract_on_parent:
+            parent_epg.provide(contract)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
+        return tenant
+
+    def setup_tenant(self, apic, **kwargs):
+        """
+        Setup the tenant configuration. The configuration is only built once per TestCase class
+        and the same Tenant instance is pushed by every test.
+        :param apic: Session instance assumed to be logged into the APIC
+        :param kwargs: Keyword arguments passed to build_tenant
+        :return: None
+        """
+        key = tuple(sorted(kwargs.items()))
+        if key not in self.baseline_tenants:
+            self.baseline_tenants[key] = self.build_tenant(**kwargs)
+        resp = self.baseline_tenants[key].push_to_apic(apic)
+        self.assertTrue(resp.ok)
+
     def delete_tenant(self):
         """
-        Delete the tenant config. Called before and after test
+        Delete the tenant config. Called before and after test.
+        The deletion is pushed a second time only if the tenant is still present after the first push
         :return: None
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         tenant.mark_as_deleted()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
-        time.sleep(4)
+        if _poll_until(lambda: not self._tenant_exists(apic, self.tenant_name)):
+            return
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
-        time.sleep(2)
-        tenants = Tenant.get(apic)
-        for tenant in tenants:
-            self.assertTrue(tenant.name != 'inheritanceautomatedtest')
+        self._wait_until(lambda: not self._tenant_exists(apic, self.tenant_name),
+                         msg='Tenant %s was not deleted' % self.tenant_name)
+
+    def _fetch_tenant(self, apic, tenant_name):
+        """
+        Get the tenant and all of its children from the APIC
+        :param apic: Session instance assumed to be logged into the APIC
+        :param tenant_name: String containing the tenant name
+        :return: Instance of Tenant
+        """
+        tenant = self._get_deep(apic, [tenant_name]).get(tenant_name)
+        self.assertIsNotNone(tenant)
+        return tenant
+
+    def _tenant_exists(self, apic, tenant_name):
+        """
+        Check whether the tenant exists using a query scoped to the tenant rather than
+        collecting all of the tenants from the APIC
+        :param apic: Session instance assumed to be logged into the APIC
+        :param tenant_name: String containing the tenant name
+        :return: True if the tenant exists on the APIC. False otherwise
+        """
+        resp = apic.get(TENANT_QUERY_URL % tenant_name)
+        self.assertTrue(resp.ok)
+        return len(resp.json()['imdata']) > 0
+
+    def _wait_until(self, predicate, timeout=10, interval=0.05, msg=None, hold=0):
+        """
+        Poll until the predicate is satisfied, backing off exponentially between polls
+        :param predicate: Callable returning True once the expected state has been reached
+        :param timeout: Maximum number of seconds to wait before failing the test
+        :param interval: Initial number of seconds between polls. Doubled after every poll up to 1 second
+        :param msg: Optional message used if the test fails due to the timeout
+        :param hold: Number of seconds that the predicate must then remain satisfied. Used for states
+                     that the tool must not change, which are usually satisfied on the first poll
+        :return: True when the predicate has been satisfied
+        """
+        if not _poll_until(predicate, timeout, interval):
+            self.fail(msg or 'Timed out after %s seconds waiting for the APIC' % timeout)
+        if hold and not _holds_for(predicate, hold):
+            self.fail(msg or 'The APIC changed within %s seconds' % hold)
+        return True
+
+    def get_child_epg(self, tenant):
+        """
+        Get the child EPG from the collected tenant
+        :param tenant: Instance of Tenant collected from the APIC
+        :return: Instance of OutsideEPG
+        """
+        l3out = _get_child(tenant, OutsideL3, 'myl3out')
+        self.assertIsNotNone(l3out)
+        return _get_child(l3out, OutsideEPG, 'childepg')
+
+    def _verify(self, apic, expected, hold=None):
+        """
+        Wait until the child EPG provides the inherited contracts, or no longer provides them
+        :param apic: Session instance assumed to be logged into the APIC
+        :param expected: Boolean indicating whether the contracts are expected to be inherited
+        :param hold: Number of seconds that the state must then remain unchanged. Defaults to SETTLE_TIME
+                     when the contracts are expected not to be inherited and to 0 otherwise
+        :return: None
+        """
+        if hold is None:
+            hold = 0 if expected else SETTLE_TIME
+
+        def is_converged():
+            tenant = self._fetch_tenant(apic, self.tenant_name)
+            childepg = self.get_child_epg(tenant)
+            self.assertIsNotNone(childepg)
+            for contract_name in self.inherited_contracts:
+                contract = _get_child(tenant, Contract, contract_name)
+                self.assertIsNotNone(contract)
+                if childepg.has_tag('inherited:fvRsProv:%s' % contract_name) != expected:
+                    return False
+                if childepg.does_provide(contract) != expected:
+                    return False
+            return True
+        self._wait_until(is_converged, hold=hold)
+
+    def verify_inherited(self, apic, not_inherited=False, hold=None):
+        """
+        Verify that the contracts have properly been inherited (or not inherited)
+        :param apic: Session instance assumed to be logged into the APIC
+        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
+        :param hold: Number of seconds that the state must then remain unchanged. See _verify
+        :return: None
+        """
+        self._verify(apic, not not_inherited, hold)
+
+    def verify_not_inherited(self, apic):
+        """
+        Verify that the contracts have not been inherited
+        :param apic: Session instance assumed to be logged into the APIC
+        :return: None
+        """
+        self._verify(apic, False)
 
     def setUp(self):
+        self._invalidate_tenants()
         self.delete_tenant()
 
     def tearDown(self):
@@ -214,69 +669,6 @@ class BaseBasicL3Out(BaseTestCase):
     """
     Base class for basic Inheritance test cases enabled on OutsideEPGs
     """
-    def setup_tenant(self, apic):
-        """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
-        """
-        tenant = Tenant('inheritanceautomatedtest')
-        context = Context('mycontext', tenant)
-        l3out = OutsideL3('myl3out', tenant)
-        parent_epg = OutsideEPG('parentepg', l3out)
-        parent_network = OutsideNetwork('5.1.1.1', parent_epg)
-        parent_network.ip = '5.1.1.1/8'
-        child_epg = OutsideEPG('childepg', l3out)
-        child_network = OutsideNetwork('5.2.1.1', child_epg)
-        child_network.ip = '5.2.1.1/16'
-        contract = Contract('mycontract', tenant)
-        parent_epg.provide(contract)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-
-    def verify_inherited(self, apic, not_inherited=False):
-        """
-        Verify that the contracts have properly been inherited (or not inherited)
-        :param apic: Session instance assumed to be logged into the APIC
-        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
-        :return: None
-        """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        l3out = tenant.get_child(OutsideL3, 'myl3out')
-        self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
-        self.assertIsNotNone(contract)
-        if not_inherited:
-            self.assertFalse(childepg.does_provide(contract))
-        else:
-            self.assertTrue(childepg.does_provide(contract))
-
-    def verify_not_inherited(self, apic):
-        """
-        Verify that the contracts have not been inherited
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
-        """
-        self.verify_inherited(apic, not_inherited=True)
 
 
 class TestBasicL3Out(BaseBasicL3Out):
@@ -287,47 +679,15 @@ class TestBasicL3Out(BaseBasicL3Out):
         """
         Basic inherit contract test
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -338,47 +698,15 @@ class TestBasicL3Out(BaseBasicL3Out):
         """
         Basic test for when inheritance is disallowed
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": False,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=False, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_not_inherited(apic)
@@ -389,47 +717,15 @@ class TestBasicL3Out(BaseBasicL3Out):
         """
         Basic test for when inheritance is disabled
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=False),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_not_inherited(apic)
@@ -440,47 +736,15 @@ class TestBasicL3Out(BaseBasicL3Out):
         """
         Basic test for getting the configuration
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=False),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         config = tool.get_config()
         # Verify that the contract is now inherited by the child EPG
@@ -493,113 +757,35 @@ class TestBasicL3OutWithInheritFrom(BaseBasicL3Out):
     """
     Basic Inheritance test cases enabled on OutsideEPGs that also use the inherit_from clause
     """
-    def setup_tenant(self, apic):
+    inherited_contracts = ('mycontract', 'mycontract-app')
+
+    def build_tenant(self):
         """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
+        Build the tenant configuration
+        :return: Instance of Tenant
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = super(TestBasicL3OutWithInheritFrom, self).build_tenant()
         app = AppProfile('myapp', tenant)
         epg = EPG('myepg', app)
         contract = Contract('mycontract-app', tenant)
         epg.provide(contract)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        super(TestBasicL3OutWithInheritFrom, self).setup_tenant(apic)
-
-    def verify_inherited(self, apic, not_inherited=False):
-        """
-        Verify that the contracts have properly been inherited (or not inherited)
-        :param apic: Session instance assumed to be logged into the APIC
-        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
-        :return: None
-        """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        l3out = tenant.get_child(OutsideL3, 'myl3out')
-        self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract-app'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract-app'))
-        for contract_name in ['mycontract', 'mycontract-app']:
-            contract = tenant.get_child(Contract, contract_name)
-            self.assertIsNotNone(contract)
-            if not_inherited:
-                self.assertFalse(childepg.does_provide(contract))
-            else:
-                self.assertTrue(childepg.does_provide(contract))
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
+        return tenant
 
     def test_basic_inherit_contract(self):
         """
         Basic inherit contract test
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True,
-                    "inherit_from": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "myepg"
-                    }
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True,
+                 inherit_from=('myapp', 'myepg', 'app')),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -610,45 +796,17 @@ class TestContractEvents(BaseTestCase):
     """
     Test contract events
     """
+    provide_contract_on_parent = False
+
     def get_config_json(self):
         """
         Get the JSON configuration
         :return: Dictionary containing the JSON configuration
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
         return config_json
 
     def get_contract(self, tenant):
@@ -658,45 +816,25 @@ class TestContractEvents(BaseTestCase):
         :return: Instance of Contract class
         """
         contract = Contract('mycontract', tenant)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
         return contract
 
-    def setup_tenant(self, apic):
+    def build_tenant(self, two_parent_epgs=False):
         """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
+        Build the tenant configuration
+        :param two_parent_epgs: Boolean indicating whether to build the configuration with 2 parent EPGs
+        :return: Instance of Tenant
         """
-        tenant = Tenant('inheritanceautomatedtest')
-        context = Context('mycontext', tenant)
-        l3out = OutsideL3('myl3out', tenant)
-        parent_epg = OutsideEPG('parentepg', l3out)
-        parent_network = OutsideNetwork('5.1.1.1', parent_epg)
-        parent_network.ip = '5.1.1.1/8'
-        child_epg = OutsideEPG('childepg', l3out)
-        child_network = OutsideNetwork('5.2.1.1', child_epg)
-        child_network.ip = '5.2.1.1/16'
-        contract = self.get_contract(tenant)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        if two_parent_epgs:
+            return self.build_tenant_with_2_parent_epgs()
+        return super(TestContractEvents, self).build_tenant()
 
-    def setup_tenant_with_2_parent_epgs(self, apic):
+    def build_tenant_with_2_parent_epgs(self):
         """
-        Setup the tenant configuration with 2 parent EPGs
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
+        Build the tenant configuration with 2 parent EPGs
+        :return: Instance of Tenant
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         context = Context('mycontext', tenant)
         l3out = OutsideL3('myl3out', tenant)
         parent_epg1 = OutsideEPG('parentepg1', l3out)
@@ -711,71 +849,50 @@ class TestContractEvents(BaseTestCase):
         child_epg = OutsideEPG('childepg', l3out)
         child_network = OutsideNetwork('5.2.1.1', child_epg)
         child_network.ip = '5.2.1.1/16'
-        contract = self.get_contract(tenant)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        return tenant
 
-    def add_contract(self, apic):
+    def setup_tenant_with_2_parent_epgs(self, apic):
         """
-        Add the contract
+        Setup the tenant configuration with 2 parent EPGs
         :param apic: Session instance assumed to be logged into the APIC
         :return: None
         """
-        tenant = Tenant('inheritanceautomatedtest')
-        l3out = OutsideL3('myl3out', tenant)
-        parent_epg = OutsideEPG('parentepg', l3out)
-        contract = self.get_contract(tenant)
-        parent_epg.provide(contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        self.setup_tenant(apic, two_parent_epgs=True)
 
-    def remove_contract(self, apic):
+    def _mutate(self, apic, actions):
         """
-        Remove the contract
+        Change the contract relations of the parent EPGs with a single push
         :param apic: Session instance assumed to be logged into the APIC
+        :param actions: List of (EPG name, 'provide' or 'dont_provide') tuples
         :return: None
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         l3out = OutsideL3('myl3out', tenant)
-        parent_epg = OutsideEPG('parentepg', l3out)
-        contract = self.get_contract(tenant)
-        parent_epg.provide(contract)
-        parent_epg.dont_provide(contract)
+        contract = Contract('mycontract')
+        for epg_name, action in actions:
+            parent_epg = OutsideEPG(epg_name, l3out)
+            # dont_provide only removes a relation that is known to the EPG instance
+            parent_epg.provide(contract)
+            if action == 'dont_provide':
+                parent_epg.dont_provide(contract)
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
 
-    def verify_inherited(self, apic, not_inherited=False):
+    def add_contract(self, apic):
         """
-        Verify that the contracts have properly been inherited (or not inherited)
+        Add the contract
         :param apic: Session instance assumed to be logged into the APIC
-        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
         :return: None
         """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        l3out = tenant.get_child(OutsideL3, 'myl3out')
-        self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
-        self.assertIsNotNone(contract)
-        if not_inherited:
-            self.assertFalse(childepg.does_provide(contract))
-        else:
-            self.assertTrue(childepg.does_provide(contract))
+        self._mutate(apic, [('parentepg', 'provide')])
 
-    def verify_not_inherited(self, apic):
+    def remove_contract(self, apic):
         """
-        Verify that the contracts have not been inherited
+        Remove the contract
         :param apic: Session instance assumed to be logged into the APIC
         :return: None
         """
-        self.verify_inherited(apic, not_inherited=True)
+        self._mutate(apic, [('parentepg', 'dont_provide')])
 
     def test_basic_inherit_contract(self):
         """
@@ -784,20 +901,16 @@ class TestContractEvents(BaseTestCase):
         self.delete_tenant()
         config_json = self.get_config_json()
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic)
-        time.sleep(2)
 
         # Add the contract
         self.add_contract(apic)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -811,27 +924,22 @@ class TestContractEvents(BaseTestCase):
         self.delete_tenant()
         config_json = self.get_config_json()
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic)
-        time.sleep(2)
 
         # Add the contract
         self.add_contract(apic)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
 
         # Remove the contract from the parent EPG
         self.remove_contract(apic)
-        time.sleep(2)
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic)
@@ -843,60 +951,17 @@ class TestContractEvents(BaseTestCase):
         Test for inheriting from 2 EPGs
         """
         self.delete_tenant()
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg1"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg2"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg1', allowed=True, enabled=False),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg2', allowed=True, enabled=False)
+        ])
 
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant_with_2_parent_epgs(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -908,77 +973,26 @@ class TestContractEvents(BaseTestCase):
         Test for inheriting from 2 EPGs and one relation deleted
         """
         self.delete_tenant()
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg1"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg2"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg1', allowed=True, enabled=False),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg2', allowed=True, enabled=False)
+        ])
 
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant_with_2_parent_epgs(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
 
         # Remove contract
-        tenant = Tenant('inheritanceautomatedtest')
-        l3out = OutsideL3('myl3out', tenant)
-        parent_epg = OutsideEPG('parentepg1', l3out)
-        contract = self.get_contract(tenant)
-        parent_epg.provide(contract)
-        parent_epg.dont_provide(contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        self._mutate(apic, [('parentepg1', 'dont_provide')])
 
         # Verify that the contract is still inherited by the child EPG
-        time.sleep(2)
-        self.verify_inherited(apic)
+        self.verify_inherited(apic, hold=SETTLE_TIME)
 
         self.delete_tenant()
 
@@ -986,79 +1000,25 @@ class TestContractEvents(BaseTestCase):
         """
         Test for inheriting from 2 EPGs and both relations deleted
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg1"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg2"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg1', allowed=True, enabled=False),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg2', allowed=True, enabled=False)
+        ])
 
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant_with_2_parent_epgs(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
 
         # Remove contracts
-        tenant = Tenant('inheritanceautomatedtest')
-        l3out = OutsideL3('myl3out', tenant)
-        contract = self.get_contract(tenant)
-        parent_epg1 = OutsideEPG('parentepg1', l3out)
-        parent_epg1.provide(contract)
-        parent_epg1.dont_provide(contract)
-        parent_epg2 = OutsideEPG('parentepg2', l3out)
-        parent_epg2.provide(contract)
-        parent_epg2.dont_provide(contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        self._mutate(apic, [('parentepg1', 'dont_provide'), ('parentepg2', 'dont_provide')])
 
         # Verify that the contract is still inherited by the child EPG
-        time.sleep(4)
         self.verify_not_inherited(apic)
 
         self.delete_tenant()
@@ -1070,145 +1030,52 @@ class TestContractEvents(BaseTestCase):
 # - add another contract and verify that it gets inherited
 # - delete the contract and verify that it gets removed
 
-# subnet cases
-# - add subnet and verify that causes to be inherited
-# - remove subnet and verify inheritance removed
-# - add 2 subnets and verify that causes to be inherited, remove 1 verify still inherited
-# - remove inherited relation
-
-
-class TestSubnetEvents(BaseTestCase):
-    """
-    Test subnet events
-    """
-    def setup_tenant(self, apic):
-        """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
-        """
-        tenant = Tenant('inheritanceautomatedtest')
-        context = Context('mycontext', tenant)
-        l3out = OutsideL3('myl3out', tenant)
-        parent_epg = OutsideEPG('parentepg', l3out)
-        parent_network = OutsideNetwork('5.1.1.1', parent_epg)
-        parent_network.ip = '5.1.1.1/8'
-        _ = OutsideEPG('childepg', l3out)
-        contract = Contract('mycontract', tenant)
-        parent_epg.provide(contract)
-        _ = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-
-    def add_child_subnet(self, apic):
-        """
-        Add a child subnet
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
-        """
-        tenant = Tenant('inheritanceautomatedtest')
-        l3out = OutsideL3('myl3out', tenant)
-        child_epg = OutsideEPG('childepg', l3out)
-        child_network = OutsideNetwork('5.2.1.1', child_epg)
-        child_network.ip = '5.2.1.1/16'
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-
-    def verify_inherited(self, apic, not_inherited=False):
-        """
-        Verify that the contracts have properly been inherited (or not inherited)
-        :param apic: Session instance assumed to be logged into the APIC
-        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
-        :return: None
-        """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        l3out = tenant.get_child(OutsideL3, 'myl3out')
-        self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
-        self.assertIsNotNone(contract)
-        if not_inherited:
-            self.assertFalse(childepg.does_provide(contract))
-        else:
-            self.assertTrue(childepg.does_provide(contract))
+# subnet cases
+# - add subnet and verify that causes to be inherited
+# - remove subnet and verify inheritance removed
+# - add 2 subnets and verify that causes to be inherited, remove 1 verify still inherited
+# - remove inherited relation
 
-    def verify_not_inherited(self, apic):
+
+class TestSubnetEvents(BaseTestCase):
+    """
+    Test subnet events
+    """
+    child_subnet = False
+
+    def add_child_subnet(self, apic):
         """
-        Verify that the contracts have not been inherited
+        Add a child subnet
         :param apic: Session instance assumed to be logged into the APIC
         :return: None
         """
-        self.verify_inherited(apic, not_inherited=True)
+        tenant = Tenant(self.tenant_name)
+        l3out = OutsideL3('myl3out', tenant)
+        child_epg = OutsideEPG('childepg', l3out)
+        child_network = OutsideNetwork('5.2.1.1', child_epg)
+        child_network.ip = '5.2.1.1/16'
+        resp = tenant.push_to_apic(apic)
+        self.assertTrue(resp.ok)
 
     def test_basic_inherit_add_subnet(self):
         """
         Basic test to inherit after adding a subnet
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=True, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic)
 
         # Add the child subnet
         self.add_child_subnet(apic)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -1220,13 +1087,12 @@ class TestMultipleOutsideEPGLevels(BaseTestCase):
     """
     Test multiple OutsideEPG levels
     """
-    def setup_tenant(self, apic):
+    def build_tenant(self):
         """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
+        Build the tenant configuration
+        :return: Instance of Tenant
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         context = Context('mycontext', tenant)
         l3out = OutsideL3('myl3out', tenant)
         grandparent_epg = OutsideEPG('grandparentepg', l3out)
@@ -1239,117 +1105,29 @@ class TestMultipleOutsideEPGLevels(BaseTestCase):
         child_network = OutsideNetwork('10.1.1.0', child_epg)
         child_network.ip = '10.1.1.0/24'
         contract = Contract('mycontract', tenant)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-
-    def verify_inherited(self, apic, not_inherited=False):
-        """
-        Verify that the contracts have properly been inherited (or not inherited)
-        :param apic: Session instance assumed to be logged into the APIC
-        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
-        :return: None
-        """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        l3out = tenant.get_child(OutsideL3, 'myl3out')
-        self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
-        self.assertIsNotNone(contract)
-        if not_inherited:
-            self.assertFalse(childepg.does_provide(contract))
-        else:
-            self.assertTrue(childepg.does_provide(contract))
-
-    def verify_not_inherited(self, apic):
-        """
-        Verify that the contracts have not been inherited
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
-        """
-        self.verify_inherited(apic, not_inherited=True)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
+        return tenant
 
     def test_provide_contract_directly_on_parent_epg(self):
         """
         Basic test to inherit after adding a subnet
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": False,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "grandparentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myl3out', name='childepg', allowed=True, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='parentepg', allowed=False, enabled=True),
+            dict(tenant=self.tenant_name, container='myl3out', name='grandparentepg', allowed=True, enabled=False)
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic)
 
         # Provide the contract from the parent EPG
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         l3out = OutsideL3('myl3out', tenant)
         parent_epg = OutsideEPG('parentepg', l3out)
         parent_network = OutsideNetwork('10.1.0.0', parent_epg)
@@ -1358,67 +1136,84 @@ class TestMultipleOutsideEPGLevels(BaseTestCase):
         parent_epg.provide(contract)
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
-        time.sleep(2)
 
         # Verify that the contract is still not inherited by the child EPG
         self.verify_not_inherited(apic)
 
-        time.sleep(2)
-
         # Verify that the parent EPG still provides the contract
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
+        tenants = Tenant.get_deep(apic, names=[self.tenant_name])
         self.assertTrue(len(tenants) > 0)
         tenant = tenants[0]
-        l3out = tenant.get_child(OutsideL3, 'myl3out')
+        l3out = _get_child(tenant, OutsideL3, 'myl3out')
         self.assertIsNotNone(l3out)
-        parentepg = l3out.get_child(OutsideEPG, 'parentepg')
+        parentepg = _get_child(l3out, OutsideEPG, 'parentepg')
         self.assertIsNotNone(parentepg)
         self.assertFalse(parentepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
+        contract = _get_child(tenant, Contract, 'mycontract')
         self.assertIsNotNone(contract)
         self.assertTrue(parentepg.does_provide(contract))
 
         self.delete_tenant()
 
 
-class BaseImportedContract(unittest.TestCase):
+class BaseImportedContract(ApicTestCase):
     """
     Base class for tests for ContractInterface
     """
-    def delete_tenants(self, provider_tenant_name, consumer_tenant_name):
+    @classmethod
+    def setUpClass(cls):
         """
-        Delete the tenants.  Called before and after tests automatically
+        The tenant configurations are built once per class and pushed by every test
+        """
+        super(BaseImportedContract, cls).setUpClass()
+        cls.tenant_configs = {}
+
+    def get_tenant_config(self, key, build):
+        """
+        Get a tenant configuration, building it only the first time it is requested in the class
+        :param key: Hashable identifying the configuration
+        :param build: Callable returning the configuration
+        :return: The configuration returned by build
+        """
+        if key not in self.tenant_configs:
+            self.tenant_configs[key] = build()
+        return self.tenant_configs[key]
+
+    def get_tenants_to_delete(self, provider_tenant_name, consumer_tenant_name):
+        """
+        Get the configuration that removes the tenants used by the test
 
         :param provider_tenant_name: String containing the tenant name exporting the contract
         :param consumer_tenant_name: String containing the tenant name consuming the imported contract
-        :return: None
+        :return: Tuple containing the list of Tenant instances to push and the set of tenant names
+                 that must no longer be present on the APIC
         """
         provider_tenant = Tenant(provider_tenant_name)
         provider_tenant.mark_as_deleted()
         consumer_tenant = Tenant(consumer_tenant_name)
         consumer_tenant.mark_as_deleted()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(4)
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-        tenants = Tenant.get(apic)
-        for tenant in tenants:
-            self.assertTrue(tenant.name != provider_tenant_name)
-            self.assertTrue(tenant.name != consumer_tenant_name)
+        return [provider_tenant, consumer_tenant], set([provider_tenant_name, consumer_tenant_name])
+
+    def delete_tenants(self, provider_tenant_name, consumer_tenant_name):
+        """
+        Delete the tenants.  Called before and after tests automatically
+
+        The deletion is pushed a second time only for the tenants still present after the first push
+
+        :param provider_tenant_name: String containing the tenant name exporting the contract
+        :param consumer_tenant_name: String containing the tenant name consuming the imported contract
+        :return: None
+        """
+        tenants, deleted_names = self.get_tenant_config(
+            ('delete', provider_tenant_name, consumer_tenant_name),
+            lambda: self.get_tenants_to_delete(provider_tenant_name, consumer_tenant_name))
+        self.push_deletion(self.apic, tenants, deleted_names)
 
     def setUp(self):
-        self.delete_tenants('inheritanceautomatedtest-provider', 'inheritanceautomatedtest-consumer')
+        self.delete_tenants(PROVIDER_TENANT_NAME, CONSUMER_TENANT_NAME)
 
     def tearDown(self):
-        self.delete_tenants('inheritanceautomatedtest-provider', 'inheritanceautomatedtest-consumer')
+        self.delete_tenants(PROVIDER_TENANT_NAME, CONSUMER_TENANT_NAME)
 
     def setup_tenants(self, apic, provider_tenant_name, consumer_tenant_name, use_contract_if=True):
         """
@@ -1429,24 +1224,32 @@ class BaseImportedContract(unittest.TestCase):
         :param consumer_tenant_name: String containing the tenant name consuming the imported contract
         :return: None
         """
+        self._invalidate_tenants()
+        tenant_jsons = self.get_tenant_config(
+            ('setup', provider_tenant_name, consumer_tenant_name, use_contract_if),
+            lambda: self.build_tenants(provider_tenant_name, consumer_tenant_name, use_contract_if))
+        # The provider is pushed first since the consumer imports its contract
+        for url, tenant_json in tenant_jsons:
+            resp = apic.push_to_apic(url, tenant_json)
+            self.assertTrue(resp.ok)
+
+    @staticmethod
+    def build_tenants(provider_tenant_name, consumer_tenant_name, use_contract_if=True):
+        """
+        Build the JSON of 2 tenants with 1 providing a contract that is consumed by the
+        other tenant
+        :param provider_tenant_name: String containing the tenant name exporting the contract
+        :param consumer_tenant_name: String containing the tenant name consuming the imported contract
+        :param use_contract_if: Boolean indicating whether the contract is consumed through a ContractInterface
+        :return: List of (URL, JSON) tuples in the order that they are to be pushed
+        """
         provider_tenant = Tenant(provider_tenant_name)
         app = AppProfile('myinheritanceapp', provider_tenant)
         epg = EPG('myepg', app)
         contract = Contract('mycontract', provider_tenant)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
         epg.provide(contract)
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        tenant_jsons = [(provider_tenant.get_url(), provider_tenant.get_json())]
 
         consumer_tenant = Tenant(consumer_tenant_name)
         context = Context('mycontext', consumer_tenant)
@@ -1459,16 +1262,15 @@ class BaseImportedContract(unittest.TestCase):
             contract_if = ContractInterface('mycontract', consumer_tenant)
             contract_if.import_contract(contract)
             parent_epg.consume_cif(contract_if)
-            resp = consumer_tenant.push_to_apic(apic)
-            self.assertTrue(resp.ok)
+            tenant_jsons.append((consumer_tenant.get_url(), consumer_tenant.get_json()))
         else:
             parent_epg.consume(contract)
             consumer_tenant_json = consumer_tenant.get_json()
             for child in consumer_tenant_json['fvTenant']['children']:
                 if 'vzBrCP' in child:
                     consumer_tenant_json['fvTenant']['children'].remove(child)
-            resp = apic.push_to_apic(consumer_tenant.get_url(), consumer_tenant_json)
-            self.assertTrue(resp.ok)
+            tenant_jsons.append((consumer_tenant.get_url(), consumer_tenant_json))
+        return tenant_jsons
 
     def add_child_subnet(self, apic, consumer_tenant_name):
         """
@@ -1477,14 +1279,52 @@ class BaseImportedContract(unittest.TestCase):
         :param consumer_tenant_name: String containing the tenant name consuming the imported contract
         :return: None
         """
-        tenant = Tenant(consumer_tenant_name)
-        l3out = OutsideL3('myl3out', tenant)
-        child_epg = OutsideEPG('childepg', l3out)
-        child_network = OutsideNetwork('5.2.1.1', child_epg)
-        child_network.ip = '5.2.1.1/16'
+        self._invalidate_tenants()
+        tenant = self.get_tenant_config(('subnet', consumer_tenant_name),
+                                        lambda: _build_child_subnet(consumer_tenant_name))
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
 
+    def _get_tenants(self, apic, provider_tenant_name, consumer_tenant_name, refresh=True):
+        """
+        Get the consumer and provider tenants and all of their children from the APIC.
+        The tenants collected while polling are reused by the verification that follows
+        :param apic: Session instance assumed to be logged into the APIC
+        :param provider_tenant_name: String containing the tenant name exporting the contract
+        :param consumer_tenant_name: String containing the tenant name consuming the imported contract
+        :param refresh: Boolean indicating whether to collect the tenants again. See _get_deep
+        :return: Tuple containing the consumer and provider Tenant instances. None if the tenant was not found
+        """
+        tenants = self._get_deep(apic, [consumer_tenant_name, provider_tenant_name], refresh)
+        return tenants.get(consumer_tenant_name), tenants.get(provider_tenant_name)
+
+    def _is_inherited(self, apic, provider_tenant_name, consumer_tenant_name, use_contract_if=True):
+        """
+        Check whether the child EPG has inherited the consumed contract. Unlike verify_inherited,
+        nothing is asserted so that this can be used to poll the APIC
+        :param apic: Session instance assumed to be logged into the APIC
+        :param provider_tenant_name: String containing the tenant name exporting the contract
+        :param consumer_tenant_name: String containing the tenant name consuming the imported contract
+        :param use_contract_if: Boolean indicating whether the contract is consumed through a ContractInterface
+        :return: True if the contract is inherited by the child EPG
+        """
+        consumer_tenant, provider_tenant = self._get_tenants(apic, provider_tenant_name, consumer_tenant_name)
+        if consumer_tenant is None:
+            return False
+        l3out = _get_child(consumer_tenant, OutsideL3, 'myl3out')
+        childepg = _get_child(l3out, OutsideEPG, 'childepg') if l3out is not None else None
+        if childepg is None:
+            return False
+        if use_contract_if:
+            contract_if = _get_child(consumer_tenant, ContractInterface, 'mycontract')
+            return (childepg.has_tag('inherited:fvRsConsIf:mycontract') and
+                    contract_if is not None and childepg.does_consume_cif(contract_if))
+        if provider_tenant is None:
+            return False
+        contract = _get_child(provider_tenant, Contract, 'mycontract')
+        return (childepg.has_tag('inherited:fvRsCons:mycontract') and
+                contract is not None and childepg.does_consume(contract))
+
     def verify_inherited(self, apic, provider_tenant_name, consumer_tenant_name,
                          not_inherited=False, use_contract_if=True):
         """
@@ -1495,20 +1335,12 @@ class BaseImportedContract(unittest.TestCase):
         :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
         :return: None
         """
-        fabric = Fabric()
-        tenants = Tenant.get_deep(apic, names=[consumer_tenant_name, provider_tenant_name], parent=fabric)
-        self.assertTrue(len(tenants) > 0)
-        consumer_tenant = None
-        provider_tenant = None
-        for tenant in tenants:
-            if tenant.name == consumer_tenant_name:
-                consumer_tenant = tenant
-            if tenant.name == provider_tenant_name:
-                provider_tenant = tenant
+        consumer_tenant, provider_tenant = self._get_tenants(apic, provider_tenant_name, consumer_tenant_name,
+                                                             refresh=False)
         self.assertIsNotNone(consumer_tenant)
-        l3out = consumer_tenant.get_child(OutsideL3, 'myl3out')
+        l3out = _get_child(consumer_tenant, OutsideL3, 'myl3out')
         self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
+        childepg = _get_child(l3out, OutsideEPG, 'childepg')
         self.assertIsNotNone(childepg)
         cons_word = 'fvRsCons'
         if use_contract_if:
@@ -1518,9 +1350,9 @@ class BaseImportedContract(unittest.TestCase):
         else:
             self.assertTrue(childepg.has_tag('inherited:%s:mycontract' % cons_word))
         if use_contract_if:
-            contract_if = consumer_tenant.get_child(ContractInterface, 'mycontract')
+            contract_if = _get_child(consumer_tenant, ContractInterface, 'mycontract')
         else:
-            contract_if = provider_tenant.get_child(Contract, 'mycontract')
+            contract_if = _get_child(provider_tenant, Contract, 'mycontract')
         self.assertIsNotNone(contract_if)
         if not_inherited:
             if use_contract_if:
@@ -1550,54 +1382,21 @@ class BaseImportedContract(unittest.TestCase):
         :param provider_tenant_name: String containing the tenant to export the contract
         :param consumer_tenant_name: String containing the tenant to import the contract
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "%s" % consumer_tenant_name,
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "%s" % consumer_tenant_name,
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
-        args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        config_json = _consumer_config(consumer_tenant_name)
+        apic = self.apic
         self.setup_tenants(apic, provider_tenant_name, consumer_tenant_name, use_contract_if=use_contract_if)
-        tool = execute_tool(args)
-        tool.add_config(config_json)
-        time.sleep(2)
+        self.start_tool(config_json)
+        self.assertTrue(_holds_for(lambda: not self._is_inherited(apic, provider_tenant_name, consumer_tenant_name,
+                                                                  use_contract_if=use_contract_if)))
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic, provider_tenant_name, consumer_tenant_name, use_contract_if=use_contract_if)
 
         # Add the child subnet
         self.add_child_subnet(apic, consumer_tenant_name)
-        time.sleep(2)
+        _poll_until(lambda: self._is_inherited(apic, provider_tenant_name, consumer_tenant_name,
+                                               use_contract_if=use_contract_if),
+                    **IMPORTED_CONTRACT_POLL)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic, provider_tenant_name, consumer_tenant_name, use_contract_if=use_contract_if)
@@ -1611,22 +1410,26 @@ class TestImportedContract(BaseImportedContract):
         """
         Basic test for inheriting after adding a subnet
         """
-        provider_tenant_name = 'inheritanceautomatedtest-provider'
-        consumer_tenant_name = 'inheritanceautomatedtest-consumer'
+        provider_tenant_name = PROVIDER_TENANT_NAME
+        consumer_tenant_name = CONSUMER_TENANT_NAME
         self.run_basic_test(provider_tenant_name, consumer_tenant_name)
 
 
-class TestImportedContractFromTenantCommon(BaseImportedContract):
+class BaseImportedContractFromTenantCommon(BaseImportedContract):
     """
-    Tests for ContractInterface when Contract is imported from Tenant common
+    Base class for tests where the Contract is provided by Tenant common. Tenant common itself is
+    never deleted, only the provider configuration that the test added to it
     """
-    def delete_tenants(self, provider_tenant_name, consumer_tenant_name):
+    xdist_group = 'tenant_common'
+
+    def get_tenants_to_delete(self, provider_tenant_name, consumer_tenant_name):
         """
-        Delete the tenants.  Called before and after tests automatically
+        Get the configuration that removes the tenants used by the test
 
         :param provider_tenant_name: String containing the tenant name exporting the contract
         :param consumer_tenant_name: String containing the tenant name consuming the imported contract
-        :return: None
+        :return: Tuple containing the list of Tenant instances to push and the set of tenant names
+                 that must no longer be present on the APIC
         """
         provider_tenant = Tenant(provider_tenant_name)
         app = AppProfile('myinheritanceapp', provider_tenant)
@@ -1636,84 +1439,53 @@ class TestImportedContractFromTenantCommon(BaseImportedContract):
 
         consumer_tenant = Tenant(consumer_tenant_name)
         consumer_tenant.mark_as_deleted()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(4)
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-        tenants = Tenant.get(apic)
-        for tenant in tenants:
-            self.assertTrue(tenant.name != consumer_tenant_name)
+        return [provider_tenant, consumer_tenant], set([consumer_tenant_name])
 
     def setUp(self):
-        self.delete_tenants('common', 'inheritanceautomatedtest-consumer')
+        self.delete_tenants('common', CONSUMER_TENANT_NAME)
 
     def tearDown(self):
-        self.delete_tenants('common', 'inheritanceautomatedtest-consumer')
+        self.delete_tenants('common', CONSUMER_TENANT_NAME)
 
+
+class TestImportedContractFromTenantCommon(BaseImportedContractFromTenantCommon):
+    """
+    Tests for ContractInterface when Contract is imported from Tenant common
+    """
     def test_basic_inherit_add_subnet_provided_by_tenant_common(self):
         """
         Basic test for ContractInterface when Contract is imported from Tenant common
         """
         provider_tenant_name = 'common'
-        consumer_tenant_name = 'inheritanceautomatedtest-consumer'
+        consumer_tenant_name = CONSUMER_TENANT_NAME
         self.run_basic_test(provider_tenant_name, consumer_tenant_name)
 
 
-class TestImportedContractInterfaceFromTenantCommon(unittest.TestCase):
+class TestImportedContractInterfaceFromTenantCommon(ApicTestCase):
     """
     Tests for contract exported from 1 tenant to tenant common and consumed by another tenant
     """
+    xdist_group = 'tenant_common'
+
     def delete_tenants(self):
         """
         Delete the tenants.  Called before and after tests automatically
 
+        All of the deletions are sent to the APIC in a single request, and sent again
+        for the tenants still present if the APIC did not process them
+
         :return: None
         """
-        # Login to the APIC
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        resp = apic.login()
-        self.assertTrue(resp.ok)
-
-        # Delete the tenant common ContractInterface
+        # Delete the tenant common ContractInterface, the consumer tenant and the provider tenant
         common_tenant = Tenant('common')
         contract_if = ContractInterface('contract-a-exported', common_tenant)
         contract_if.mark_as_deleted()
-        resp = common_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-
-        # Delete the consumer tenant
-        consumer_tenant = Tenant('inheritanceautomatedtest-consumer')
+        consumer_tenant = Tenant(CONSUMER_TENANT_NAME)
         consumer_tenant.mark_as_deleted()
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-
-        # Delete the provider tenant
-        provider_tenant = Tenant('inheritanceautomatedtest-provider')
+        provider_tenant = Tenant(PROVIDER_TENANT_NAME)
         provider_tenant.mark_as_deleted()
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-
-        # Delete the consumer tenant
-        consumer_tenant = Tenant('inheritanceautomatedtest-consumer')
-        consumer_tenant.mark_as_deleted()
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-
-        tenants = Tenant.get(apic)
-        for tenant in tenants:
-            self.assertTrue(tenant.name != consumer_tenant.name and tenant.name != provider_tenant.name)
+        self.push_deletion(self.apic, [common_tenant, consumer_tenant, provider_tenant],
+                           set([consumer_tenant.name, provider_tenant.name]))
 
     def setUp(self):
         self.delete_tenants()
@@ -1721,6 +1493,37 @@ class TestImportedContractInterfaceFromTenantCommon(unittest.TestCase):
     def tearDown(self):
         self.delete_tenants()
 
+    def _get_tenants(self, apic, refresh=True):
+        """
+        Get tenant common, the provider and the consumer tenants and all of their children from the APIC.
+        The tenants collected while polling are reused by the verification that follows
+        :param apic: Session instance assumed to be logged into the APIC
+        :param refresh: Boolean indicating whether to collect the tenants again. See _get_deep
+        :return: Dictionary of the Tenant instances found on the APIC keyed by tenant name
+        """
+        return self._get_deep(apic, ['common',
+                                     PROVIDER_TENANT_NAME,
+                                     CONSUMER_TENANT_NAME], refresh)
+
+    def _is_inherited(self, apic):
+        """
+        Check whether the child EPG has inherited the ContractInterface from tenant common.
+        Unlike verify_inherited, nothing is asserted so that this can be used to poll the APIC
+        :param apic: Session instance assumed to be logged into the APIC
+        :return: True if the ContractInterface is inherited by the child EPG
+        """
+        tenants = self._get_tenants(apic)
+        consumer_tenant = tenants.get(CONSUMER_TENANT_NAME)
+        common_tenant = tenants.get('common')
+        if consumer_tenant is None or common_tenant is None:
+            return False
+        l3out = _get_child(consumer_tenant, OutsideL3, 'myl3out')
+        childepg = _get_child(l3out, OutsideEPG, 'childepg') if l3out is not None else None
+        contract_if = _get_child(common_tenant, ContractInterface, 'contract-a-exported')
+        if childepg is None or contract_if is None:
+            return False
+        return childepg.has_tag('inherited:fvRsConsIf:contract-a-exported') and childepg.does_consume_cif(contract_if)
+
     def verify_inherited(self, apic, not_inherited=False):
         """
         Verify that the contracts have properly been inherited (or not inherited)
@@ -1728,37 +1531,24 @@ class TestImportedContractInterfaceFromTenantCommon(unittest.TestCase):
         :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
         :return: None
         """
-        fabric = Fabric()
-        tenants = Tenant.get_deep(apic,
-                                  names=['common',
-                                         'inheritanceautomatedtest-provider',
-                                         'inheritanceautomatedtest-consumer'],
-                                  parent=fabric)
-        self.assertTrue(len(tenants) > 0)
-        consumer_tenant = None
-        provider_tenant = None
-        common_tenant = None
-        for tenant in tenants:
-            if tenant.name == 'inheritanceautomatedtest-consumer':
-                consumer_tenant = tenant
-            if tenant.name == 'inheritanceautomatedtest-provider':
-                provider_tenant = tenant
-            if tenant.name == 'common':
-                common_tenant = tenant
+        tenants = self._get_tenants(apic, refresh=False)
+        consumer_tenant = tenants.get(CONSUMER_TENANT_NAME)
+        provider_tenant = tenants.get(PROVIDER_TENANT_NAME)
+        common_tenant = tenants.get('common')
         self.assertIsNotNone(consumer_tenant)
         self.assertIsNotNone(provider_tenant)
         self.assertIsNotNone(common_tenant)
-        l3out = consumer_tenant.get_child(OutsideL3, 'myl3out')
+        l3out = _get_child(consumer_tenant, OutsideL3, 'myl3out')
         self.assertIsNotNone(l3out)
-        childepg = l3out.get_child(OutsideEPG, 'childepg')
+        childepg = _get_child(l3out, OutsideEPG, 'childepg')
         self.assertIsNotNone(childepg)
         if not_inherited:
             self.assertFalse(childepg.has_tag('inherited:fvRsConsIf:contract-a-exported'))
         else:
             self.assertTrue(childepg.has_tag('inherited:fvRsConsIf:contract-a-exported'))
-        contract_if = consumer_tenant.get_child(ContractInterface, 'contract-a-exported')
+        contract_if = _get_child(consumer_tenant, ContractInterface, 'contract-a-exported')
         self.assertIsNone(contract_if)
-        contract_if = common_tenant.get_child(ContractInterface, 'contract-a-exported')
+        contract_if = _get_child(common_tenant, ContractInterface, 'contract-a-exported')
         self.assertEqual(contract_if.get_parent(), common_tenant)
         if not_inherited:
             self.assertFalse(childepg.does_consume_cif(contract_if))
@@ -1780,21 +1570,12 @@ class TestImportedContractInterfaceFromTenantCommon(unittest.TestCase):
         :param apic: Session instance that is assumed to be logged into the APIC
         :return: None
         """
-        provider_tenant = Tenant('inheritanceautomatedtest-provider')
+        self._invalidate_tenants()
+        provider_tenant = Tenant(PROVIDER_TENANT_NAME)
         app = AppProfile('myinheritanceapp', provider_tenant)
         epg = EPG('myepg', app)
         contract = Contract('mycontract', provider_tenant)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
         epg.provide(contract)
         resp = provider_tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
@@ -1804,9 +1585,10 @@ class TestImportedContractInterfaceFromTenantCommon(unittest.TestCase):
         contract_if.import_contract(contract)
         resp = common_tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
-        time.sleep(2)
+        cif_url = CONTRACT_IF_QUERY_URL % ('common', 'contract-a-exported')
+        _poll_until(lambda: len(apic.get(cif_url).json()['imdata']) > 0, **IMPORTED_CONTRACT_POLL)
 
-        consumer_tenant = Tenant('inheritanceautomatedtest-consumer')
+        consumer_tenant = Tenant(CONSUMER_TENANT_NAME)
         context = Context('mycontext', consumer_tenant)
         l3out = OutsideL3('myl3out', consumer_tenant)
         parent_epg = OutsideEPG('parentepg', l3out)
@@ -1825,114 +1607,36 @@ class TestImportedContractInterfaceFromTenantCommon(unittest.TestCase):
         """
         Basic test for when ContractInterface is imported from Tenant common
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest-consumer",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest-consumer",
-                        "epg_container": {
-                            "name": "myl3out",
-                            "container_type": "l3out"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
-        args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        config_json = _consumer_config(CONSUMER_TENANT_NAME)
+        apic = self.apic
         self.setup_tenants(apic)
-        tool = execute_tool(args)
-        tool.add_config(config_json)
-        time.sleep(2)
+        self.start_tool(config_json)
+        self.assertTrue(_holds_for(lambda: not self._is_inherited(apic)))
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic)
 
         # Add the child subnet
-        tenant = Tenant('inheritanceautomatedtest-consumer')
-        l3out = OutsideL3('myl3out', tenant)
-        child_epg = OutsideEPG('childepg', l3out)
-        child_network = OutsideNetwork('5.2.1.1', child_epg)
-        child_network.ip = '5.2.1.1/16'
+        self._invalidate_tenants()
+        tenant = _build_child_subnet(CONSUMER_TENANT_NAME)
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
-
-        time.sleep(2)
+        _poll_until(lambda: self._is_inherited(apic), **IMPORTED_CONTRACT_POLL)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
 
 
-class TestContractFromTenantCommonUsedInTenant(BaseImportedContract):
+class TestContractFromTenantCommonUsedInTenant(BaseImportedContractFromTenantCommon):
     """
     Tests for when Contract is imported from Tenant common not using ContractInterface
     """
-    def delete_tenants(self, provider_tenant_name, consumer_tenant_name, use_contract_if=True):
-        """
-        Delete the tenants.  Called before and after tests automatically
-
-        :param provider_tenant_name: String containing the tenant name exporting the contract
-        :param consumer_tenant_name: String containing the tenant name consuming the imported contract
-        :return: None
-        """
-        provider_tenant = Tenant(provider_tenant_name)
-        app = AppProfile('myinheritanceapp', provider_tenant)
-        app.mark_as_deleted()
-        contract = Contract('mycontract', provider_tenant)
-        contract.mark_as_deleted()
-
-        consumer_tenant = Tenant(consumer_tenant_name)
-        consumer_tenant.mark_as_deleted()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(4)
-        resp = provider_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        resp = consumer_tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
-        time.sleep(2)
-        tenants = Tenant.get(apic)
-        for tenant in tenants:
-            self.assertTrue(tenant.name != consumer_tenant_name)
-
-    def setUp(self):
-        self.delete_tenants('common', 'inheritanceautomatedtest-consumer')
-
-    def tearDown(self):
-        self.delete_tenants('common', 'inheritanceautomatedtest-consumer')
-
     def test_basic_inherit_add_subnet_provided_by_tenant_common(self):
         """
         Basic test for ContractInterface when Contract is imported from Tenant common
         """
         provider_tenant_name = 'common'
-        consumer_tenant_name = 'inheritanceautomatedtest-consumer'
+        consumer_tenant_name = CONSUMER_TENANT_NAME
         self.run_basic_test(provider_tenant_name, consumer_tenant_name, use_contract_if=False)
 
 
@@ -1940,119 +1644,46 @@ class TestBasicAppProfile(BaseTestCase):
     """
     Basic Inheritance test cases enabled on Application Profile EPGs
     """
-    def setup_tenant(self, apic):
+    def build_tenant(self):
         """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
+        Build the tenant configuration
+        :return: Instance of Tenant
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         context = Context('mycontext', tenant)
         app = AppProfile('myapp', tenant)
         parent_epg = EPG('parentepg', app)
         child_epg = EPG('childepg', app)
         contract = Contract('mycontract', tenant)
         parent_epg.provide(contract)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
+        return tenant
 
-    def verify_inherited(self, apic, not_inherited=False):
+    def get_child_epg(self, tenant):
         """
-        Verify that the contracts have properly been inherited (or not inherited)
-        :param apic: Session instance assumed to be logged into the APIC
-        :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
-        :return: None
+        Get the child EPG from the collected tenant
+        :param tenant: Instance of Tenant collected from the APIC
+        :return: Instance of EPG
         """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        app = tenant.get_child(AppProfile, 'myapp')
+        app = _get_child(tenant, AppProfile, 'myapp')
         self.assertIsNotNone(app)
-        childepg = app.get_child(EPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
-        self.assertIsNotNone(contract)
-        if not_inherited:
-            self.assertFalse(childepg.does_provide(contract))
-        else:
-            self.assertTrue(childepg.does_provide(contract))
-
-    def verify_not_inherited(self, apic):
-        """
-        Verify that the contracts have not been inherited
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
-        """
-        self.verify_inherited(apic, not_inherited=True)
+        return _get_child(app, EPG, 'childepg')
 
     def test_basic_inherit_contract(self):
         """
         Basic inherit contract test
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True,
-                    "inherit_from": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    }
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myapp', name='childepg', allowed=True, enabled=True,
+                 container_type='app', inherit_from=('myapp', 'parentepg', 'app')),
+            dict(tenant=self.tenant_name, container='myapp', name='parentepg', allowed=True, enabled=False,
+                 container_type='app')
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -2063,47 +1694,17 @@ class TestBasicAppProfile(BaseTestCase):
         """
         Basic test for when inheritance is disallowed
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": False,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myapp', name='childepg', allowed=True, enabled=True,
+                 container_type='app'),
+            dict(tenant=self.tenant_name, container='myapp', name='parentepg', allowed=False, enabled=False,
+                 container_type='app')
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_not_inherited(apic)
@@ -2114,47 +1715,17 @@ class TestBasicAppProfile(BaseTestCase):
         """
         Basic test for when inheritance is disabled
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myapp', name='childepg', allowed=True, enabled=False,
+                 container_type='app'),
+            dict(tenant=self.tenant_name, container='myapp', name='parentepg', allowed=True, enabled=False,
+                 container_type='app')
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_not_inherited(apic)
@@ -2165,47 +1736,17 @@ class TestBasicAppProfile(BaseTestCase):
         """
         Basic test for getting the configuration
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myapp', name='childepg', allowed=True, enabled=False,
+                 container_type='app'),
+            dict(tenant=self.tenant_name, container='myapp', name='parentepg', allowed=True, enabled=False,
+                 container_type='app')
+        ])
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(2)
 
         config = tool.get_config()
         self.assertEqual(config, config_json)
@@ -2217,13 +1758,13 @@ class TestBasicToolRestart(BaseTestCase):
     """
     Basic Inheritance test cases for when the inheritance tool is run and then restarted
     """
-    def setup_tenant(self, apic, provide_contract=True):
+    def build_tenant(self, provide_contract=True):
         """
-        Setup the tenant configuration
-        :param apic: Session instance assumed to be logged into the APIC
-        :return: None
+        Build the tenant configuration
+        :param provide_contract: Boolean indicating whether the parent EPG provides the contract
+        :return: Instance of Tenant
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         context = Context('mycontext', tenant)
         app = AppProfile('myapp', tenant)
         parent_epg = EPG('parentepg', app)
@@ -2231,37 +1772,16 @@ class TestBasicToolRestart(BaseTestCase):
         if provide_contract:
             contract = Contract('mycontract', tenant)
             parent_epg.provide(contract)
-            entry = FilterEntry('webentry1',
-                                applyToFrag='no',
-                                arpOpc='unspecified',
-                                dFromPort='80',
-                                dToPort='80',
-                                etherT='ip',
-                                prot='tcp',
-                                sFromPort='1',
-                                sToPort='65535',
-                                tcpRules='unspecified',
-                                parent=contract)
-        resp = tenant.push_to_apic(apic)
-        self.assertTrue(resp.ok)
+            entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
+        return tenant
 
     def add_contract_to_parent(self, apic):
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         app = AppProfile('myapp', tenant)
         parent_epg = EPG('parentepg', app)
         contract = Contract('mycontract', tenant)
         parent_epg.provide(contract)
-        entry = FilterEntry('webentry1',
-                            applyToFrag='no',
-                            arpOpc='unspecified',
-                            dFromPort='80',
-                            dToPort='80',
-                            etherT='ip',
-                            prot='tcp',
-                            sFromPort='1',
-                            sToPort='65535',
-                            tcpRules='unspecified',
-                            parent=contract)
+        entry = FilterEntry('webentry1', parent=contract, **_WEB_FILTER_KW)
         resp = tenant.push_to_apic(apic)
         self.assertTrue(resp.ok)
 
@@ -2271,7 +1791,7 @@ class TestBasicToolRestart(BaseTestCase):
         :param apic: Session instance assumed to be logged into the APIC
         :return: None
         """
-        tenant = Tenant('inheritanceautomatedtest')
+        tenant = Tenant(self.tenant_name)
         app = AppProfile('myapp', tenant)
         parent_epg = EPG('parentepg', app)
         contract = Contract('mycontract', tenant)
@@ -2281,31 +1801,28 @@ class TestBasicToolRestart(BaseTestCase):
 
     def verify_inherited(self, apic, contract_provided=True, not_inherited=False):
         """
-        Verify that the contracts have properly been inherited (or not inherited)
+        Verify that the contracts have properly been inherited (or not inherited). A state where the
+        contracts are not inherited must remain unchanged for SETTLE_TIME seconds
         :param apic: Session instance assumed to be logged into the APIC
         :param not_inherited: Boolean to indicate whether to verify that the contracts have properly been inherited or not
         :return: None
         """
-        tenants = Tenant.get_deep(apic, names=['inheritanceautomatedtest'])
-        self.assertTrue(len(tenants) > 0)
-        tenant = tenants[0]
-        app = tenant.get_child(AppProfile, 'myapp')
-        self.assertIsNotNone(app)
-        childepg = app.get_child(EPG, 'childepg')
-        self.assertIsNotNone(childepg)
-        if not_inherited:
-            self.assertFalse(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        else:
-            self.assertTrue(childepg.has_tag('inherited:fvRsProv:mycontract'))
-        contract = tenant.get_child(Contract, 'mycontract')
-        if not contract_provided:
-            self.assertIsNone(contract)
-            return
-        self.assertIsNotNone(contract)
-        if not_inherited:
-            self.assertFalse(childepg.does_provide(contract))
-        else:
-            self.assertTrue(childepg.does_provide(contract))
+        def is_converged():
+            tenant = self._fetch_tenant(apic, self.tenant_name)
+            app = _get_child(tenant, AppProfile, 'myapp')
+            self.assertIsNotNone(app)
+            childepg = _get_child(app, EPG, 'childepg')
+            self.assertIsNotNone(childepg)
+            inherited = not not_inherited
+            if childepg.has_tag('inherited:fvRsProv:mycontract') != inherited:
+                return False
+            contract = _get_child(tenant, Contract, 'mycontract')
+            if not contract_provided:
+                self.assertIsNone(contract)
+                return True
+            self.assertIsNotNone(contract)
+            return childepg.does_provide(contract) == inherited
+        self._wait_until(is_converged, hold=SETTLE_TIME if not_inherited else 0)
 
     def verify_not_inherited(self, apic, contract_provided=True):
         """
@@ -2315,54 +1832,17 @@ class TestBasicToolRestart(BaseTestCase):
         """
         self.verify_inherited(apic, contract_provided=contract_provided, not_inherited=True)
 
-    @staticmethod
-    def get_config():
+    def get_config(self):
         """
         Get the configuration
         :return: Dictionary containing the JSON configuration
         """
-        config_json = {
-            "apic": {
-                "user_name": credentials.username,
-                "password": credentials.password,
-                "ip_address": credentials.ip_address,
-                "use_https": False
-            },
-            "inheritance_policies": [
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "childepg"
-                    },
-                    "allowed": True,
-                    "enabled": True,
-                    "inherit_from": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    }
-                },
-                {
-                    "epg": {
-                        "tenant": "inheritanceautomatedtest",
-                        "epg_container": {
-                            "name": "myapp",
-                            "container_type": "app"
-                        },
-                        "name": "parentepg"
-                    },
-                    "allowed": True,
-                    "enabled": False
-                }
-            ]
-        }
+        config_json = _make_config([
+            dict(tenant=self.tenant_name, container='myapp', name='childepg', allowed=True, enabled=True,
+                 container_type='app', inherit_from=('myapp', 'parentepg', 'app')),
+            dict(tenant=self.tenant_name, container='myapp', name='parentepg', allowed=True, enabled=False,
+                 container_type='app')
+        ])
         return config_json
 
     def test_basic_inherit_contract_add_parent_contract_during_outage(self):
@@ -2371,17 +1851,15 @@ class TestBasicToolRestart(BaseTestCase):
         """
         config_json = self.get_config()
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic, provide_contract=False)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is not inherited by the child EPG
         self.verify_not_inherited(apic, contract_provided=False)
         tool.exit()
-        time.sleep(4)
+        self._wait_until(lambda: not tool.monitor.is_alive())
 
         # Remove the contract from the parent EPG
         self.add_contract_to_parent(apic)
@@ -2389,7 +1867,6 @@ class TestBasicToolRestart(BaseTestCase):
         # Start the tool again
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is now inherited by the child EPG
         self.verify_inherited(apic)
@@ -2401,34 +1878,30 @@ class TestBasicToolRestart(BaseTestCase):
         """
         config_json = self.get_config()
         args = TestArgs()
-        apic = Session(credentials.url, credentials.username, credentials.password)
-        apic.login()
+        apic = self.apic
         self.setup_tenant(apic, provide_contract=True)
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(4)
 
         # Verify that the contract is now inherited by the child EPG
-        tool.exit()
         self.verify_inherited(apic)
-        time.sleep(4)
+        tool.exit()
+        self._wait_until(lambda: not tool.monitor.is_alive())
 
         # Remove the contract from the parent EPG
         self.remove_contract_from_parent(apic)
 
-        time.sleep(2)
-
         # Start the tool again
         tool = execute_tool(args)
         tool.add_config(config_json)
-        time.sleep(6)
 
         # Verify that the contract is no longer inherited by the child EPG
-        tool.exit()
         self.verify_not_inherited(apic)
+        tool.exit()
 
 
 credentials = ApicCredentials()
+credentials.set_config(DEFAULT_INI_FILENAME)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='ACI Inheritance Tool')
@@ -2473,12 +1946,4 @@ if __name__ == '__main__':
         sys.exit()
 
     # Run the tests
-    live = unittest.TestSuite()
-    live.addTest(unittest.makeSuite(TestWithoutApicCommunication))
-    live.addTest(unittest.makeSuite(TestBasicL3Out))
-    live.addTest(unittest.makeSuite(TestContractEvents))
-    live.addTest(unittest.makeSuite(TestSubnetEvents))
-    live.addTest(unittest.makeSuite(TestImportedContract))
-    live.addTest(unittest.makeSuite(TestImportedContractFromTenantCommon))
-    live.addTest(unittest.makeSuite(TestBasicAppProfile))
-    unittest.main(defaultTest='live', argv=sys.argv[:1] + unittest_args)
+    unittest.main(argv=sys.argv[:1] + unittest_args)